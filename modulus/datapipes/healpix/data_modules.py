@@ -400,6 +400,7 @@ class TimeSeriesDataModule:
         pin_memory: bool = True,
         prebuilt_dataset: bool = True,
         forecast_init_times: Optional[Sequence] = None,
+        prefetch_factor: Optional[int] = None,
     ):
         """
         Parameters
@@ -470,6 +471,9 @@ class TimeSeriesDataModule:
                 - this is only applied to the test dataloader
                 - providing this parameter configures the data loader to only produce this number of samples, and
                     NOT produce any target array.
+        prefetch_factor: int, optional
+            Number of batches loaded in advance by each worker, only valid with `num_workers > 0`.
+            default None (uses the PyTorch DataLoader default)
         """
         super().__init__()
         self.src_directory = src_directory
@@ -495,6 +499,7 @@ class TimeSeriesDataModule:
         self.cube_dim = cube_dim
         self.num_workers = num_workers
         self.pin_memory = pin_memory
+        self.prefetch_factor = prefetch_factor
         self.prebuilt_dataset = prebuilt_dataset
         self.forecast_init_times = forecast_init_times
 
@@ -707,6 +712,7 @@ class TimeSeriesDataModule:
             dataset=self.train_dataset,
             pin_memory=self.pin_memory,
             num_workers=self.num_workers,
+            prefetch_factor=self.prefetch_factor,
             shuffle=shuffle,
             drop_last=drop_last,
             sampler=sampler,
@@ -745,6 +751,7 @@ class TimeSeriesDataModule:
             dataset=self.val_dataset,
             pin_memory=self.pin_memory,
             num_workers=self.num_workers,
+            prefetch_factor=self.prefetch_factor,
             shuffle=False,
             drop_last=False,
             sampler=sampler,
@@ -783,6 +790,7 @@ class TimeSeriesDataModule:
             dataset=self.test_dataset,
             pin_memory=self.pin_memory,
             num_workers=self.num_workers,
+            prefetch_factor=self.prefetch_factor,
             shuffle=False,
             drop_last=False,
             sampler=sampler,
@@ -828,6 +836,7 @@ class CoupledTimeSeriesDataModule(TimeSeriesDataModule):
         prebuilt_dataset: bool = True,
         forecast_init_times: Optional[Sequence] = None,
         couplings: Sequence = None,
+        prefetch_factor: Optional[int] = None,
     ):
         """
         Parameters
@@ -901,6 +910,9 @@ class CoupledTimeSeriesDataModule(TimeSeriesDataModule):
         couplings: Sequence, optional
             a Sequence of dictionaries that define the mechanics of couplings with other earth system
             components. default None
+        prefetch_factor: int, optional
+            Number of batches loaded in advance by each worker, only valid with `num_workers > 0`.
+            default None (uses the PyTorch DataLoader default)
         """
         self.couplings = couplings
         super().__init__(
@@ -930,6 +942,7 @@ class CoupledTimeSeriesDataModule(TimeSeriesDataModule):
             pin_memory,
             prebuilt_dataset,
             forecast_init_times,
+            prefetch_factor,
         )
 
     def _get_coupled_vars(self):
@@ -603,6 +603,9 @@ def test_TimeSeriesDataModule_get_dataloaders(
         scaling=scaling_double_dict,
         splits=splits,
         shuffle=False,
+        num_workers=2,
+        pin_memory=False,
+        prefetch_factor=3,
     )
 
     # with 1 shard should get no sampler
@@ -617,6 +620,13 @@ def test_TimeSeriesDataModule_get_dataloaders(
     test_dataloader, test_sampler = timeseries_dm.test_dataloader(num_shards=1)
     assert test_sampler is None
     assert isinstance(test_dataloader, DataLoader)
+
+    # loader settings are passed through from the data module, these differ
+    # from both the data module and DataLoader defaults
+    for dataloader in (train_dataloader, val_dataloader, test_dataloader):
+        assert dataloader.num_workers == 2
+        assert dataloader.prefetch_factor == 3
+        assert not dataloader.pin_memory
     print(f"dataset lenght {len}")
     # with >1 shard should be distributed sampler
     train_dataloader, train_sampler = timeseries_dm.train_dataloader(num_shards=2)
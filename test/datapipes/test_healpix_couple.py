@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import random
+import re
 import shutil
 import warnings
 from pathlib import Path
@@ -22,8 +22,8 @@ from pathlib import Path
 import numpy as np
 import pytest
 import xarray as xr
-from omegaconf import DictConfig
-from pytest_utils import nfsdata_or_fail
+from omegaconf import DictConfig, OmegaConf
+from pytest_utils import _nfsdata_or_fail, nfsdata_or_fail
 from torch.utils.data import DataLoader
 from torch.utils.data.distributed import DistributedSampler
 
@@ -34,33 +34,96 @@ from modulus.datapipes.healpix.data_modules import (
 )
 from modulus.distributed import DistributedManager
 
+# expected error messages, compiled once for reuse in pytest.raises
+_TIMESTEP_MULT = re.compile(r"'time_step' must be a multiple of 'data_time_step' ")
+_GAP_MULT = re.compile(r"'gap' must be a multiple of 'data_time_step' ")
+_INVALID_SCALING = re.compile(r"one or more of the input data variables")
+_FORECAST_BATCH_SIZE = re.compile(
+    r"providing 'forecast_init_times' to CoupledTimeSeriesDataset requires `batch_size=1`"
+)
+_INVALID_DATA_FORMAT = re.compile(r"'data_format' must be one of")
 
-@pytest.fixture
+# dataloader settings configured on the shared data module, chosen to differ
+# from both the data module defaults (4 workers, pinned memory) and the
+# DataLoader default prefetch_factor of 2 so the pass-through is observable
+LOADER_NUM_WORKERS = 2
+LOADER_PREFETCH_FACTOR = 3
+LOADER_PIN_MEMORY = False
+
+
+@pytest.fixture(scope="session")
 def data_dir():
     path = "/data/nfs/modulus-data/datasets/healpix/"
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dataset_name():
     name = "healpix"
     return name
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def create_path():
     path = "/data/nfs/modulus-data/datasets/healpix/merge"
     return path
 
 
+@pytest.fixture(scope="session")
+def ds_path(data_dir, dataset_name):
+    return Path(data_dir, f"{dataset_name}.zarr")
+
+
+@pytest.fixture(scope="session")
+def zarr_ds(ds_path, pytestconfig):
+    """Test dataset, opened once and shared by all tests in the session"""
+    _nfsdata_or_fail(pytestconfig)
+    # keep the dask-backed default, as used by the data modules, consolidated
+    # metadata is read in a single request when the store provides it
+    return xr.open_zarr(ds_path)
+
+
+@pytest.fixture(scope="session")
+def expected_constants(zarr_ds):
+    """Constants reshaped to [F, C, H, W] as returned by the datasets, stored
+    C-contiguous so comparisons traverse both operands in memory order"""
+    return np.ascontiguousarray(zarr_ds.constants.values.transpose(1, 0, 2, 3))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def distributed_manager():
+    """Initializes the DistributedManager once for all data module tests"""
+    DistributedManager.initialize()
+    yield DistributedManager()
+    DistributedManager.cleanup()
+
+
 def delete_dataset(create_path, dataset_name):
     """Helper that deletes a requested dataset at the specified location"""
-    dataset_path = f"{create_path}/{dataset_name}.zarr"
-    if Path(dataset_path).exists():
-        shutil.rmtree(dataset_path)
+    shutil.rmtree(f"{create_path}/{dataset_name}.zarr", ignore_errors=True)
 
 
-@pytest.fixture
+def assert_targets_allclose(targets, targets_expected):
+    """Helper that compares the first sample of a target batch against the expected
+    DataArray"""
+    # coords are copied from the expected array, so only values are compared
+    actual = xr.DataArray(
+        targets[0][:, 0, :, :],
+        dims=targets_expected.dims,
+        coords=targets_expected.coords,
+    )
+    xr.testing.assert_allclose(actual, targets_expected)
+
+
+def frozen_config(config):
+    """Helper that creates a read-only DictConfig which can be shared between tests"""
+    config = DictConfig(config)
+    OmegaConf.set_readonly(config, True)
+    OmegaConf.set_struct(config, True)
+    return config
+
+
+@pytest.fixture(scope="session")
 def scaling_dict():
     scaling = {
         "t2m0": {"mean": 287.8665771484375, "std": 14.86227798461914},
@@ -72,10 +135,10 @@ def scaling_dict():
         "z500": {"mean": 55625.9609375, "std": 2681.712890625},
         "tp6": {"mean": 1, "std": 0, "log_epsilon": 1e-6},
     }
-    return DictConfig(scaling)
+    return frozen_config(scaling)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scaling_double_dict():
     scaling = {
         "t2m0": {"mean": 0, "std": 2},
@@ -87,90 +150,120 @@ def scaling_double_dict():
         "z500": {"mean": 0, "std": 2},
         "tp6": {"mean": 0, "std": 2, "log_epsilon": 1e-6},
     }
-    return DictConfig(scaling)
+    return frozen_config(scaling)
 
 
-@nfsdata_or_fail
-def test_ConstantCoupler(data_dir, dataset_name, scaling_dict, pytestconfig):
+@pytest.fixture
+def make_timeseries_ds(zarr_ds, scaling_double_dict):
+    """Builds a CoupledTimeSeriesDataset, overriding only the given arguments"""
+
+    def _make(**overrides):
+        kwargs = {"dataset": zarr_ds, "scaling": scaling_double_dict, "batch_size": 2}
+        kwargs.update(overrides)
+        return CoupledTimeSeriesDataset(**kwargs)
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def timeseries_dm(
+    data_dir, create_path, dataset_name, scaling_double_dict, pytestconfig
+):
+    """Data module shared by the dataloader tests, built once per module"""
+    _nfsdata_or_fail(pytestconfig)
     variables = ["z500", "z1000"]
-    # open our test dataset
-    ds_path = Path(data_dir, dataset_name + ".zarr")
-    zarr_ds = xr.open_zarr(ds_path)
+    splits = {
+        "train_date_start": "1979-01-01",
+        "train_date_end": "1979-01-01T21:00",
+        "val_date_start": "1979-01-02",
+        "val_date_end": "1979-01-02T09:00",
+        "test_date_start": "1979-01-02T12:00",
+        "test_date_end": "1979-01-02T18:00",
+    }
+
+    # use the prebuilt dataset
+    return CoupledTimeSeriesDataModule(
+        src_directory=create_path,
+        dst_directory=data_dir,
+        dataset_name=dataset_name,
+        input_variables=variables,
+        batch_size=1,
+        prebuilt_dataset=True,
+        scaling=scaling_double_dict,
+        splits=splits,
+        shuffle=False,
+        num_workers=LOADER_NUM_WORKERS,
+        pin_memory=LOADER_PIN_MEMORY,
+        prefetch_factor=LOADER_PREFETCH_FACTOR,
+    )
 
+
+@nfsdata_or_fail
+def test_ConstantCoupler(zarr_ds, scaling_dict, pytestconfig):
+    variables = ["z500", "z1000"]
     coupler = ConstantCoupler(dataset=zarr_ds, batch_size=1, variables=variables)
     assert isinstance(coupler, ConstantCoupler)
 
 
 @nfsdata_or_fail
-def test_TrailingAverageCoupler(data_dir, dataset_name, scaling_dict, pytestconfig):
+def test_TrailingAverageCoupler(zarr_ds, scaling_dict, pytestconfig):
     variables = ["z500", "z1000"]
-    # open our test dataset
-    ds_path = Path(data_dir, dataset_name + ".zarr")
-    zarr_ds = xr.open_zarr(ds_path)
-
     coupler = TrailingAverageCoupler(dataset=zarr_ds, batch_size=1, variables=variables)
     assert isinstance(coupler, TrailingAverageCoupler)
 
 
-@nfsdata_or_fail
-def test_CoupledTimeSeriesDataset_initialization(
-    data_dir, dataset_name, scaling_dict, pytestconfig
-):
-    # open our test dataset
-    ds_path = Path(data_dir, dataset_name + ".zarr")
-    zarr_ds = xr.open_zarr(ds_path)
+# (constructor kwargs, expected exception, expected message) for invalid datasets
+INIT_ERROR_CASES = [
+    # timestep not being a multiple of datatime step
+    pytest.param(
+        {"data_time_step": "2h", "time_step": "5h"},
+        ValueError,
+        _TIMESTEP_MULT,
+        id="time_step",
+    ),
+    # gap not being a multiple of datatime step
+    pytest.param(
+        {"data_time_step": "2h", "time_step": "6h", "gap": "3h"},
+        ValueError,
+        _GAP_MULT,
+        id="gap",
+    ),
+    # invalid scaling variable on input
+    pytest.param(
+        {
+            "data_time_step": "3h",
+            "time_step": "6h",
+            "scaling": DictConfig({"bogosity": {"mean": 0, "std": 42}}),
+        },
+        KeyError,
+        _INVALID_SCALING,
+        id="invalid_scaling",
+    ),
+]
 
-    # check for failure of timestep not being a multiple of datatime step
-    with pytest.raises(
-        ValueError, match=("'time_step' must be a multiple of 'data_time_step' ")
-    ):
-        timeseries_ds = CoupledTimeSeriesDataset(
-            dataset=zarr_ds,
-            data_time_step="2h",
-            time_step="5h",
-            scaling=scaling_dict,
-        )
 
-    # check for failure of gap not being a multiple of datatime step
-    with pytest.raises(
-        ValueError, match=("'gap' must be a multiple of 'data_time_step' ")
-    ):
-        timeseries_ds = CoupledTimeSeriesDataset(
-            dataset=zarr_ds,
-            data_time_step="2h",
-            time_step="6h",
-            gap="3h",
-            scaling=scaling_dict,
-        )
+@nfsdata_or_fail
+@pytest.mark.parametrize("kwargs, exception, match", INIT_ERROR_CASES)
+def test_CoupledTimeSeriesDataset_init_errors(
+    zarr_ds, scaling_dict, kwargs, exception, match, pytestconfig
+):
+    kwargs = {"scaling": scaling_dict, **kwargs}
+    with pytest.raises(exception, match=match):
+        CoupledTimeSeriesDataset(dataset=zarr_ds, **kwargs)
 
-    # check for failure of invalid scaling variable on input
-    invalid_scaling = DictConfig(
-        {
-            "bogosity": {"mean": 0, "std": 42},
-        }
-    )
-    with pytest.raises(KeyError, match=("one or more of the input data variables")):
-        timeseries_ds = CoupledTimeSeriesDataset(
-            dataset=zarr_ds,
-            data_time_step="3h",
-            time_step="6h",
-            scaling=invalid_scaling,
-        )
 
+@nfsdata_or_fail
+def test_CoupledTimeSeriesDataset_initialization(zarr_ds, scaling_dict, pytestconfig):
     # check for warning on batch size > 1 and forecast mode
-    warnings.filterwarnings("error")
-    with pytest.raises(
-        UserWarning,
-        match=(
-            "providing 'forecast_init_times' to CoupledTimeSeriesDataset requires `batch_size=1`"
-        ),
-    ):
-        timeseries_ds = CoupledTimeSeriesDataset(
-            dataset=zarr_ds,
-            scaling=scaling_dict,
-            batch_size=2,
-            forecast_init_times=zarr_ds.time[:2],
-        )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(UserWarning, match=_FORECAST_BATCH_SIZE):
+            timeseries_ds = CoupledTimeSeriesDataset(
+                dataset=zarr_ds,
+                scaling=scaling_dict,
+                batch_size=2,
+                forecast_init_times=zarr_ds.time[:2],
+            )
 
     # test no scaling
     timeseries_ds = CoupledTimeSeriesDataset(
@@ -205,36 +298,24 @@ def test_CoupledTimeSeriesDataset_initialization(
 
 @nfsdata_or_fail
 def test_CoupledTimeSeriesDataset_get_constants(
-    data_dir, dataset_name, scaling_dict, pytestconfig
+    zarr_ds, expected_constants, scaling_dict, pytestconfig
 ):
-    # open our test dataset
-    ds_path = Path(data_dir, dataset_name + ".zarr")
-    zarr_ds = xr.open_zarr(ds_path)
-
     timeseries_ds = CoupledTimeSeriesDataset(
         dataset=zarr_ds,
         scaling=scaling_dict,
     )
 
     # constants are reshaped
-    expected = np.transpose(zarr_ds.constants.values, axes=(1, 0, 2, 3))
-    outvar = timeseries_ds.get_constants()
-    assert np.array_equal(
-        expected,
-        outvar,
-    )
+    outvar = np.ascontiguousarray(timeseries_ds.get_constants())
+    np.testing.assert_array_equal(outvar, expected_constants)
 
 
 @nfsdata_or_fail
-def test_CoupledTimeSeriesDataset_len(
-    data_dir, dataset_name, scaling_dict, pytestconfig
+@pytest.mark.parametrize("init_times", [1, 2, 8])
+def test_CoupledTimeSeriesDataset_len_forecast(
+    zarr_ds, scaling_dict, init_times, pytestconfig
 ):
-    # open our test dataset
-    ds_path = Path(data_dir, dataset_name + ".zarr")
-    zarr_ds = xr.open_zarr(ds_path)
-
     # check forecast mode
-    init_times = random.randint(1, len(zarr_ds.time.values))
     timeseries_ds = CoupledTimeSeriesDataset(
         dataset=zarr_ds,
         scaling=scaling_dict,
@@ -243,6 +324,9 @@ def test_CoupledTimeSeriesDataset_len(
     )
     assert len(timeseries_ds) == init_times
 
+
+@nfsdata_or_fail
+def test_CoupledTimeSeriesDataset_len(zarr_ds, scaling_dict, pytestconfig):
     # check train mode
     timeseries_ds = CoupledTimeSeriesDataset(
         dataset=zarr_ds,
@@ -267,19 +351,9 @@ def test_CoupledTimeSeriesDataset_len(
 
 
 @nfsdata_or_fail
-def test_CoupledTimeSeriesDataset_get(
-    data_dir, dataset_name, scaling_double_dict, pytestconfig
-):
-    # open our test dataset
-    ds_path = Path(data_dir, dataset_name + ".zarr")
-    zarr_ds = xr.open_zarr(ds_path)
-
+def test_CoupledTimeSeriesDataset_get(zarr_ds, make_timeseries_ds, pytestconfig):
     batch_size = 2
-    timeseries_ds = CoupledTimeSeriesDataset(
-        dataset=zarr_ds,
-        scaling=scaling_double_dict,
-        batch_size=batch_size,
-    )
+    timeseries_ds = make_timeseries_ds(batch_size=batch_size)
 
     # check for invalid index
     invalid_idx = len(zarr_ds.targets) + 1
@@ -298,73 +372,55 @@ def test_CoupledTimeSeriesDataset_get(
     targets_expected = zarr_ds.targets[batch_size].transpose(
         "face", "channel_out", "height", "width"
     )
-    targets_expected = targets_expected.to_numpy() / 2
-    assert np.array_equal(targets[0][:, 0, :, :], targets_expected)
+    targets_expected = targets_expected / 2
+    assert_targets_allclose(targets, targets_expected)
 
-    # check for negative index
-    inputs, targets = timeseries_ds[-1]
-    targets_expected = zarr_ds.targets[12].transpose(
-        "face", "channel_out", "height", "width"
-    )
-    targets_expected = targets_expected.to_numpy() / 2
-
-    # we're not dropping incomplete elements by default
-    assert len(targets) == 0
+    # we're not dropping incomplete elements by default, so the last
+    # element is empty
+    assert len(timeseries_ds[len(timeseries_ds) - 1][1]) == 0
 
     # this time dropping incomplete so that we get a full sample sample
-    timeseries_ds = CoupledTimeSeriesDataset(
-        dataset=zarr_ds,
-        scaling=scaling_double_dict,
-        batch_size=batch_size,
-        drop_last=True,
-    )
+    timeseries_ds = make_timeseries_ds(batch_size=batch_size, drop_last=True)
 
     inputs, targets = timeseries_ds[-1]
     targets_expected = zarr_ds.targets[-1 - batch_size].transpose(
         "face", "channel_out", "height", "width"
     )
-    targets_expected = targets_expected.to_numpy() / 2
-    assert np.array_equal(targets[0][:, 0, :, :], targets_expected)
+    targets_expected = targets_expected / 2
+    assert_targets_allclose(targets, targets_expected)
 
     # With insolation we get 1 extra channel
-    timeseries_ds = CoupledTimeSeriesDataset(
-        dataset=zarr_ds,
-        scaling=scaling_double_dict,
-        batch_size=batch_size,
-        drop_last=True,
-        add_insolation=True,
+    timeseries_ds = make_timeseries_ds(
+        batch_size=batch_size, drop_last=True, add_insolation=True
     )
     assert (len(inputs)) + 1 == len(timeseries_ds[0][0])
 
+
+@nfsdata_or_fail
+@pytest.mark.parametrize("init_times", [1, 2, 8])
+def test_CoupledTimeSeriesDataset_get_forecast(
+    zarr_ds, make_timeseries_ds, init_times, pytestconfig
+):
     # nothing should change with forecast mode other than getting just inputs
-    init_times = random.randint(1, len(zarr_ds.time.values))
-    timeseries_ds = CoupledTimeSeriesDataset(
-        dataset=zarr_ds,
-        scaling=scaling_double_dict,
-        batch_size=1,
-        forecast_init_times=zarr_ds.time[:init_times],
+    timeseries_ds = make_timeseries_ds(
+        batch_size=1, forecast_init_times=zarr_ds.time[:init_times]
     )
     inputs = timeseries_ds[0]
-
-    assert np.array_equal(targets[0][:, 0, :, :], targets_expected)
+    assert isinstance(inputs, list)
 
     # insolation adds 1 extra channel
-    init_times = random.randint(1, len(zarr_ds.time.values))
-    timeseries_ds = CoupledTimeSeriesDataset(
-        dataset=zarr_ds,
-        scaling=scaling_double_dict,
+    timeseries_ds = make_timeseries_ds(
         batch_size=1,
         add_insolation=True,
         forecast_init_times=zarr_ds.time[:init_times],
     )
     assert (len(inputs)) + 1 == len(timeseries_ds[0])
 
-    # No constants in input data
-    init_times = random.randint(1, len(zarr_ds.time.values))
+    # No constants in input data, drop_vars gives a new view of the shared
+    # dataset without re-reading the store
     zarr_ds_no_const = zarr_ds.drop_vars("constants")
-    timeseries_ds = CoupledTimeSeriesDataset(
+    timeseries_ds = make_timeseries_ds(
         dataset=zarr_ds_no_const,
-        scaling=scaling_double_dict,
         batch_size=1,
         forecast_init_times=zarr_ds.time[:init_times],
     )
@@ -373,7 +429,7 @@ def test_CoupledTimeSeriesDataset_get(
 
 @nfsdata_or_fail
 def test_CoupledTimeSeriesDataModule_initialization(
-    data_dir, create_path, dataset_name, scaling_double_dict, pytestconfig
+    data_dir, create_path, dataset_name, zarr_ds, scaling_double_dict, pytestconfig
 ):
     variables = ["z500", "z1000"]
     splits = {
@@ -385,12 +441,8 @@ def test_CoupledTimeSeriesDataModule_initialization(
         "test_date_end": "2018-12-31T18:00",
     }
 
-    # open our test dataset
-    ds_path = Path(data_dir, dataset_name + ".zarr")
-    zarr_ds = xr.open_zarr(ds_path)
-
     # test with an invalid mode
-    with pytest.raises(ValueError, match=("'data_format' must be one of")):
+    with pytest.raises(ValueError, match=_INVALID_DATA_FORMAT):
         timeseries_dm = CoupledTimeSeriesDataModule(
             src_directory=data_dir,
             dst_directory=create_path,
@@ -400,7 +452,6 @@ def test_CoupledTimeSeriesDataModule_initialization(
         )
 
     # use the prebuilt dataset
-    # Internally initializes DistributedManager
     timeseries_dm = CoupledTimeSeriesDataModule(
         src_directory=create_path,
         dst_directory=data_dir,
@@ -449,18 +500,21 @@ def test_CoupledTimeSeriesDataModule_initialization(
         splits=DictConfig(splits),
     )
     assert isinstance(timeseries_dm, CoupledTimeSeriesDataModule)
-    DistributedManager.cleanup()
 
 
 @nfsdata_or_fail
 def test_CoupledTimeSeriesDataModule_get_constants(
-    data_dir, create_path, dataset_name, scaling_double_dict, pytestconfig
+    data_dir,
+    create_path,
+    dataset_name,
+    expected_constants,
+    scaling_double_dict,
+    pytestconfig,
 ):
     variables = ["z500", "z1000"]
     constants = {"lsm": "lsm"}
 
     # No constants
-    # Internally initializes DistributedManager
     timeseries_dm = CoupledTimeSeriesDataModule(
         src_directory=create_path,
         dst_directory=data_dir,
@@ -486,14 +540,8 @@ def test_CoupledTimeSeriesDataModule_get_constants(
         constants=constants,
     )
 
-    # open our test dataset
-    ds_path = Path(data_dir, dataset_name + ".zarr")
-    zarr_ds = xr.open_zarr(ds_path)
-    expected = np.transpose(zarr_ds.constants.values, axes=(1, 0, 2, 3))
-
-    assert np.array_equal(
-        timeseries_dm.get_constants(),
-        expected,
+    np.testing.assert_array_equal(
+        np.ascontiguousarray(timeseries_dm.get_constants()), expected_constants
     )
 
     # with splits we're doing forecasting and get
@@ -509,64 +557,29 @@ def test_CoupledTimeSeriesDataModule_get_constants(
         constants=constants,
     )
 
-    assert np.array_equal(
-        timeseries_dm.get_constants(),
-        expected,
+    np.testing.assert_array_equal(
+        np.ascontiguousarray(timeseries_dm.get_constants()), expected_constants
     )
-    DistributedManager.cleanup()
 
 
 @nfsdata_or_fail
+@pytest.mark.parametrize("split", ["train", "val", "test"])
+@pytest.mark.parametrize("num_shards", [1, 2])
 def test_CoupledTimeSeriesDataModule_get_dataloaders(
-    data_dir, create_path, dataset_name, scaling_double_dict, pytestconfig
+    timeseries_dm, split, num_shards, pytestconfig
 ):
-    variables = ["z500", "z1000"]
-    splits = {
-        "train_date_start": "1979-01-01",
-        "train_date_end": "1979-01-01T21:00",
-        "val_date_start": "1979-01-02",
-        "val_date_end": "1979-01-02T09:00",
-        "test_date_start": "1979-01-02T12:00",
-        "test_date_end": "1979-01-02T18:00",
-    }
-
-    # use the prebuilt dataset
-    # Internally initializes DistributedManager
-    timeseries_dm = CoupledTimeSeriesDataModule(
-        src_directory=create_path,
-        dst_directory=data_dir,
-        dataset_name=dataset_name,
-        input_variables=variables,
-        batch_size=1,
-        prebuilt_dataset=True,
-        scaling=scaling_double_dict,
-        splits=splits,
-        shuffle=False,
+    loader, sampler = getattr(timeseries_dm, f"{split}_dataloader")(
+        num_shards=num_shards
     )
-
-    # with 1 shard should get no sampler
-    train_dataloader, train_sampler = timeseries_dm.train_dataloader(num_shards=1)
-    assert train_sampler is None
-    assert isinstance(train_dataloader, DataLoader)
-
-    val_dataloader, val_sampler = timeseries_dm.val_dataloader(num_shards=1)
-    assert val_sampler is None
-    assert isinstance(val_dataloader, DataLoader)
-
-    test_dataloader, test_sampler = timeseries_dm.test_dataloader(num_shards=1)
-    assert test_sampler is None
-    assert isinstance(test_dataloader, DataLoader)
-    print(f"dataset lenght {len}")
-    # with >1 shard should be distributed sampler
-    train_dataloader, train_sampler = timeseries_dm.train_dataloader(num_shards=2)
-    assert isinstance(train_sampler, DistributedSampler)
-    assert isinstance(train_dataloader, DataLoader)
-
-    val_dataloader, val_sampler = timeseries_dm.val_dataloader(num_shards=2)
-    assert isinstance(val_sampler, DistributedSampler)
-    assert isinstance(val_dataloader, DataLoader)
-
-    test_dataloader, test_sampler = timeseries_dm.test_dataloader(num_shards=2)
-    assert isinstance(test_sampler, DistributedSampler)
-    assert isinstance(test_dataloader, DataLoader)
-    DistributedManager.cleanup()
+    assert isinstance(loader, DataLoader)
+
+    # with 1 shard should get no sampler, with >1 shard should be distributed sampler
+    if num_shards == 1:
+        assert sampler is None
+    else:
+        assert isinstance(sampler, DistributedSampler)
+
+    # loader settings are passed through from the data module
+    assert loader.num_workers == LOADER_NUM_WORKERS
+    assert loader.prefetch_factor == LOADER_PREFETCH_FACTOR
+    assert loader.pin_memory == LOADER_PIN_MEMORY